@@ -8,6 +8,10 @@ import re
 import operator
 from functools import reduce
 
+# Compiled regexes reused across validations, keyed by pattern. The few
+# patterns used for validation are static, so each one is compiled once.
+_regex_cache = {}
+
 
 class InputValidator:
     """
@@ -21,7 +25,10 @@ class InputValidator:
         :param regex_str: Regular expression to do the matching
         :return: True if it matched, False otherwise.
         """
-        regex = re.compile(regex_str)
+        regex = _regex_cache.get(regex_str)
+        if regex is None:
+            regex = re.compile(regex_str)
+            _regex_cache[regex_str] = regex
         matching = regex.match(name)
         if matching:
             return matching.group() == name
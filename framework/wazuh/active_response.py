@@ -1,32 +1,49 @@
 # Copyright (C) 2015-2019, Wazuh Inc.
 # Created by Wazuh, Inc. <info@wazuh.com>.
 # This program is a free software; you can redistribute it and/or modify it under the terms of GPLv2
+from os import stat
+
 from wazuh import common
 from wazuh.exception import WazuhException
 from wazuh.agent import Agent
 from wazuh.ossec_queue import OssecQueue
 
+# Parsed ar.conf cache, keyed by (path, mtime, size) so the file is only
+# re-read when it changes on disk.
+_commands_cache = {}
+
 
 def get_commands():
     ar_conf_path = '{0}/etc/shared/ar.conf'.format(common.ossec_path)
 
+    ar_conf_stat = stat(ar_conf_path)
+    cache_key = (ar_conf_path, ar_conf_stat.st_mtime, ar_conf_stat.st_size)
+    if cache_key in _commands_cache:
+        return _commands_cache[cache_key]
+
     commands = []
     with open(ar_conf_path) as f:
         for line in f:
             cmd = line.split(" - ")[0]
             commands.append(cmd)
 
+    if len(_commands_cache) > 8:
+        _commands_cache.clear()
+    _commands_cache[cache_key] = commands
+
     return commands
 
 
+shell_escapes = ('"', '\'', '\t', ';', '`', '>', '<', '|', '#', '*', '[', ']', '{', '}', '&', '$', '!', ':', '(', ')')
+
+
 def shell_escape(command):
     """
     Escapes some characters in the command before sending it
     """
-    shell_escapes = ['"', '\'', '\t', ';', '`', '>', '<', '|', '#', '*', '[', ']', '{', '}', '&', '$', '!', ':', '(', ')']
     for shell_esc_char in shell_escapes:
         command = command.replace(shell_esc_char, "\\"+shell_esc_char)
-    
+
     return command
 
 